@@ -13,21 +13,30 @@ Features:
 Save as: quartz_music_player_final_v2.py
 Requires: customtkinter, pygame, mutagen, pillow
 Install: pip install customtkinter pygame mutagen pillow
+Optional: pip install tinytag (faster track length probing)
 """
 import os
 import json
+import hashlib
+import threading
 import random
+import queue
+import time
 import io
+import importlib
+import wave
+from collections import OrderedDict
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import filedialog, messagebox
 import customtkinter as ctk
 import pygame
 from PIL import Image, ImageTk, ImageOps
 
-from mutagen.mp3 import MP3
-from mutagen.flac import FLAC
-from mutagen.mp4 import MP4
-from mutagen.id3 import ID3, APIC, error as ID3Error
+try:
+    from tinytag import TinyTag   # header-only parser, much cheaper than mutagen for duration
+except ImportError:
+    TinyTag = None
 
 # ----------- Config -----------
 ctk.set_appearance_mode("Dark")
@@ -35,9 +44,32 @@ ctk.set_default_color_theme("blue")
 
 APP_W, APP_H = 1100, 660
 PLAYLIST_FILE = "playlist.json"
-
+ART_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "quartz", "art")
+ART_CACHE_MAX_BYTES = 64 * 1024 * 1024   # oldest thumbnails are pruned past this
+ART_PRUNE_EVERY = 200                     # cache writes between prunes
+# album art resampling: bilinear is fast and looks the same at 160 px; QUARTZ_ART_HQ=1 for Lanczos
+_RESAMPLE = getattr(Image, "Resampling", Image)
+ART_RESAMPLE = _RESAMPLE.LANCZOS if os.environ.get("QUARTZ_ART_HQ") == "1" else _RESAMPLE.BILINEAR
+_ART_EXTS = {".mp3", ".m4a", ".mp4", ".flac"}   # formats that can carry embedded art
+_AUDIO_EXTS = frozenset({"mp3", "flac", "wav", "m4a", "mp4", "aac", "ogg"})  # folder scan, no dot
+_ADD_CHUNK = 500                                 # paths per _add_paths batch during folder scan
+
+# smaller buffer = lower play/seek latency; raise it (1024/2048) if audio crackles
+try:
+    AUDIO_BUFFER = int(os.environ.get("QUARTZ_AUDIO_BUFFER", "512"))
+except ValueError:
+    AUDIO_BUFFER = 512
+if AUDIO_BUFFER <= 0:
+    AUDIO_BUFFER = 512
+
+pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=AUDIO_BUFFER)
 pygame.mixer.init()
 
+# track end comes from the mixer itself, so the loop only ticks for the slider
+UPDATE_MS = 500
+META_POLL_MS = 50   # how often the GUI thread drains finished metadata jobs
+ART_PHOTO_MAX = 8   # Tk images kept in memory: current track, prefetches, a few recent
+
 # ----------- Helpers -----------
 def format_time(sec):
     try:
@@ -46,62 +78,220 @@ def format_time(sec):
     except:
         return "00:00"
 
-def get_length(path):
-    """Primary length getter using mutagen where possible."""
-    ext = os.path.splitext(path)[1].lower()
+# mutagen is imported per format on first use, so startup doesn't pay for it
+_MUTAGEN_NAMES = {
+    "MP3": ("mutagen.mp3", "MP3"),
+    "FLAC": ("mutagen.flac", "FLAC"),
+    "MP4": ("mutagen.mp4", "MP4"),
+    "OggVorbis": ("mutagen.oggvorbis", "OggVorbis"),
+    "ID3": ("mutagen.id3", "ID3"),
+    "ID3Error": ("mutagen.id3", "error"),
+}
+_mutagen = {}
+
+def _mg(name):
+    cls = _mutagen.get(name)
+    if cls is None:
+        mod, attr = _MUTAGEN_NAMES[name]
+        cls = _mutagen[name] = getattr(importlib.import_module(mod), attr)
+    return cls
+
+def _ext(path):
+    return os.path.splitext(path)[1].lower()
+
+_MP3_RATES = (44100, 48000, 32000)   # MPEG-1; halved for MPEG-2, quartered for 2.5
+
+def _fast_mp3_length(path):
+    """Length from the Xing/Info or VBRI header of the first MP3 frame.
+    Reads only the ID3v2 header and ~4 KB; returns None when there is no such
+    header (plain CBR files), leaving the full parse to mutagen."""
+    with open(path, "rb") as f:
+        head = f.read(10)
+        start = 0
+        if head[:3] == b"ID3" and len(head) == 10:
+            size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+            start = 10 + size + (10 if head[5] & 0x10 else 0)   # footer flag
+        f.seek(start)
+        buf = f.read(4096)
+    i = buf.find(b"\xff")
+    while 0 <= i < len(buf) - 4:
+        b1, b2, b3 = buf[i + 1], buf[i + 2], buf[i + 3]
+        version = (b1 >> 3) & 3          # 0: 2.5, 2: 2, 3: 1
+        layer = (b1 >> 1) & 3            # 1: III, 2: II, 3: I
+        rate_idx = (b2 >> 2) & 3
+        if (b1 & 0xE0) == 0xE0 and version != 1 and layer and rate_idx != 3 and (b2 >> 4) not in (0, 15):
+            rate = _MP3_RATES[rate_idx] >> {3: 0, 2: 1, 0: 2}[version]
+            if layer == 3:
+                spf = 384
+            elif layer == 2 or version == 3:
+                spf = 1152
+            else:
+                spf = 576
+            mono = (b3 >> 6) == 3
+            side = (17 if mono else 32) if version == 3 else (9 if mono else 17)
+            x = i + 4 + side
+            if buf[x:x + 4] in (b"Xing", b"Info") and buf[x + 7] & 1:
+                frames = int.from_bytes(buf[x + 8:x + 12], "big")
+            elif buf[i + 36:i + 40] == b"VBRI":
+                frames = int.from_bytes(buf[i + 50:i + 54], "big")
+            else:
+                return None
+            return frames * spf / float(rate) if frames else None
+        i = buf.find(b"\xff", i + 1)
+    return None
+
+def get_length(path, ext=None):
+    """Primary length getter: MP3 VBR header, then tinytag if installed, then mutagen."""
+    ext = ext or _ext(path)
+    if ext == ".mp3":
+        try:
+            d = _fast_mp3_length(path)
+            if d and d > 0:
+                return d
+        except:
+            pass
+    if TinyTag is not None:
+        try:
+            d = TinyTag.get(path, tags=False).duration
+            if d and d > 0:
+                return d
+        except:
+            pass
     try:
         if ext == ".mp3":
-            return MP3(path).info.length
+            return _mg("MP3")(path).info.length
         if ext == ".flac":
-            return FLAC(path).info.length
+            return _mg("FLAC")(path).info.length
         if ext in (".mp4", ".m4a", ".aac"):
-            return MP4(path).info.length
-        # fallback may raise but handled by caller
-        return pygame.mixer.Sound(path).get_length()
+            return _mg("MP4")(path).info.length
+        if ext == ".ogg":
+            return _mg("OggVorbis")(path).info.length
+        if ext == ".wav":
+            # header only; never decode the whole file just for a duration
+            with wave.open(path, "rb") as w:
+                return w.getnframes() / float(w.getframerate())
+        return 0.0
     except:
         return 0.0
 
-def get_length_fallback(path):
-    """Try get_length (mutagen), then pygame Sound as a fallback."""
+def get_length_fallback(path, ext=None):
+    """get_length that never raises; 0.0 means unknown (UI shows 00:00)."""
     try:
-        l = get_length(path)
+        l = get_length(path, ext)
         if l and l > 0:
             return l
     except:
         pass
-    try:
-        s = pygame.mixer.Sound(path)
-        return s.get_length()
-    except:
-        return 0.0
+    return 0.0
 
-def extract_embedded_art(path):
-    """Return PIL.Image or None. Supports MP3 APIC, MP4 covr, FLAC pictures."""
-    ext = os.path.splitext(path)[1].lower()
+def extract_embedded_art_data(path, ext=None):
+    """Return the raw picture bytes or None. Supports MP3 APIC, MP4 covr, FLAC pictures."""
+    ext = ext or _ext(path)
+    if ext not in _ART_EXTS:
+        return None
     try:
         if ext == ".mp3":
             try:
-                tags = ID3(path)
-            except ID3Error:
+                tags = _mg("ID3")(path)
+            except _mg("ID3Error"):
                 return None
             apics = tags.getall("APIC")
             if apics:
-                return Image.open(io.BytesIO(apics[0].data)).convert("RGBA")
+                return apics[0].data
             return None
         elif ext in (".m4a", ".mp4"):
-            audio = MP4(path)
+            audio = _mg("MP4")(path)
             covr = audio.tags.get("covr")
             if covr:
-                return Image.open(io.BytesIO(covr[0])).convert("RGBA")
+                return bytes(covr[0])
             return None
         elif ext == ".flac":
-            audio = FLAC(path)
+            audio = _mg("FLAC")(path)
             if audio.pictures:
-                return Image.open(io.BytesIO(audio.pictures[0].data)).convert("RGBA")
+                return audio.pictures[0].data
             return None
     except:
         return None
 
+def art_cache_key(data=None, src=None):
+    """Cache key for a thumbnail: embedded art by a hash of its bytes (so an
+    album's tracks share one entry), a cover file by its path."""
+    if data is not None:
+        return "data:" + hashlib.sha1(data).hexdigest()
+    return "file:" + src
+
+def _art_cache_path(key):
+    # the resample filter is part of the key so QUARTZ_ART_HQ takes effect on cached art
+    raw = f"{key}|{int(ART_RESAMPLE)}".encode("utf-8", "surrogateescape")
+    return os.path.join(ART_CACHE_DIR, hashlib.sha1(raw).hexdigest() + ".png")
+
+def read_art_cache(key, src=None):
+    """Return the cached thumbnail for key, else None. With src (a cover file)
+    the entry only counts if it is newer than src."""
+    cache = _art_cache_path(key)
+    try:
+        mtime = os.path.getmtime(cache)
+        if src is None or mtime >= os.path.getmtime(src):
+            img = Image.open(cache)
+            img.load()
+            os.utime(cache)   # mark as recently used for prune_art_cache
+            return img
+    except:
+        pass
+    return None
+
+_art_writes = 0
+_art_writes_lock = threading.Lock()
+
+def write_art_cache(key, img):
+    """Store a resized thumbnail under key; failures are ignored (cache is best-effort)."""
+    global _art_writes
+    cache = _art_cache_path(key)
+    tmp = f"{cache}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(ART_CACHE_DIR, exist_ok=True)
+        img.save(tmp, "PNG")
+        os.replace(tmp, cache)
+    except:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        return
+    with _art_writes_lock:
+        _art_writes += 1
+        prune = _art_writes % ART_PRUNE_EVERY == 0
+    if prune:
+        prune_art_cache()
+
+def prune_art_cache(max_bytes=ART_CACHE_MAX_BYTES):
+    """Delete least recently used thumbnails until the cache fits in max_bytes."""
+    files = []
+    total = 0
+    try:
+        with os.scandir(ART_CACHE_DIR) as it:
+            for entry in it:
+                if entry.name.endswith(".png"):
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    files.append((st.st_mtime, st.st_size, entry.path))
+                    total += st.st_size
+    except OSError:
+        return
+    if total <= max_bytes:
+        return
+    files.sort()
+    for _, size, p in files:
+        try:
+            os.remove(p)
+        except OSError:
+            continue
+        total -= size
+        if total <= max_bytes:
+            break
+
 # ----------- App -----------
 class QuartzPlayer(ctk.CTk):
     def __init__(self):
@@ -112,13 +302,36 @@ class QuartzPlayer(ctk.CTk):
 
         # state
         self.playlist = []            # list of file paths
+        self._playlist_set = set()    # same paths, for O(1) duplicate checks
+        self.basenames = []           # display names, parallel to playlist
+        self._lower_names = []        # lowercase basenames, parallel to playlist
+        self._visible_indices = []    # listbox row -> playlist index
+        self._filter_job = None       # pending debounced filter
+        self._seek_job = None         # pending debounced seek while dragging
+        self._last_vol = -1.0         # last volume pushed to the mixer
         self.idx = None               # current index
+        self._loaded_path = None      # path shown in the header (set by _load_track)
         self.playing = False
         self.paused = False
         self.length = 0.0
         self.shuffle = False
         self.repeat = "off"           # off / all / one
-        self._manual_seek_pos = None  # used after seeking to stabilize UI
+        self._play_base = 0.0         # monotonic time at which track position 0 played
+        self._pause_at = None         # monotonic time of pause, None while running
+        self._update_job = None       # pending _update_loop tick; None while idle/paused
+        self._last_curr_text = None   # last values pushed by _update_loop,
+        self._last_slider_pct = None  # None forces the next redraw
+        self._meta_cache = {}         # path -> {mtime, length}, playlist paths only
+        self._art_photos = OrderedDict()  # path -> (mtime, PhotoImage or None), small LRU
+        self._meta_pending = set()    # paths queued on the bulk pool
+        self._pool = ThreadPoolExecutor(max_workers=4)       # bulk metadata on add
+        self._prio_pool = ThreadPoolExecutor(max_workers=1)  # track being loaded now
+        self._pool.submit(prune_art_cache)
+        self._meta_results = queue.Queue()  # worker -> GUI thread, drained by _drain_meta
+        self._meta_outstanding = 0    # submitted jobs whose result hasn't been drained
+        self._meta_poll_job = None    # pending _drain_meta poll; None when no jobs are out
+        self._prefetch = []           # futures for upcoming tracks' metadata
+        self._shuffle_queue = []      # pre-picked shuffle indices, so they can be prefetched
 
         # layout
         self.grid_columnconfigure(0, weight=1)
@@ -130,8 +343,7 @@ class QuartzPlayer(ctk.CTk):
         self._build_footer()
         self._bind_shortcuts()
 
-        # start update loop
-        self.after(250, self._update_loop)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
     # ---- Left: Playlist ----
     def _build_left(self):
@@ -147,7 +359,7 @@ class QuartzPlayer(ctk.CTk):
         self.search_var = tk.StringVar()
         search = ctk.CTkEntry(left, placeholder_text="Search...", textvariable=self.search_var)
         search.grid(row=1, column=0, sticky="ew", padx=12, pady=6)
-        search.bind("<KeyRelease>", lambda e: self._filter_playlist())
+        search.bind("<KeyRelease>", lambda e: self._schedule_filter())
 
         # dark list container
         list_container = ctk.CTkFrame(left, fg_color="#0f0f10", corner_radius=8)
@@ -208,7 +420,7 @@ class QuartzPlayer(ctk.CTk):
         self.curr_lbl.grid(row=0, column=0, padx=12)
         self.total_lbl = ctk.CTkLabel(prog, text="/ 00:00")
         self.total_lbl.grid(row=0, column=2, padx=12)
-        self.slider = ctk.CTkSlider(prog, from_=0, to=100, command=self._on_seek)
+        self.slider = ctk.CTkSlider(prog, from_=0, to=100, command=self._schedule_seek)
         self.slider.grid(row=0, column=1, sticky="ew", padx=8)
 
         # controls
@@ -267,21 +479,52 @@ class QuartzPlayer(ctk.CTk):
         folder = filedialog.askdirectory()
         if not folder:
             return
-        exts = (".mp3", ".flac", ".wav", ".m4a", ".mp4", ".aac", ".ogg")
         found = []
-        for r, _, files in os.walk(folder):
-            for f in files:
-                if f.lower().endswith(exts):
-                    found.append(os.path.join(r, f))
+        stack = [folder]
+        while stack:
+            subdirs = []
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.path)
+                                continue
+                            # no dot means no extension: a file named "mp3" is not audio
+                            _, dot, ext = entry.name.rpartition(".")
+                            if dot and ext.lower() in _AUDIO_EXTS and entry.is_file():
+                                found.append(entry.path)
+                        except OSError:
+                            pass
+            except OSError:
+                continue
+            # reversed so subfolders are visited in listing order
+            stack.extend(reversed(subdirs))
+            if len(found) >= _ADD_CHUNK:
+                self._add_paths(found)
+                found = []
+                self.update_idletasks()
         self._add_paths(found)
 
     def _add_paths(self, paths):
         added = False
+        q = self.search_var.get().strip().lower()
+        names = []   # collected rows, inserted with a single Tcl call below
         for p in paths:
-            if p and p not in self.playlist:
+            if p and p not in self._playlist_set:
+                name = os.path.basename(p)
+                lower = name.lower()
+                if not q or q in lower:
+                    self._visible_indices.append(len(self.playlist))
+                    names.append(name)
                 self.playlist.append(p)
-                self.listbox.insert(tk.END, os.path.basename(p))
+                self._playlist_set.add(p)
+                self.basenames.append(name)
+                self._lower_names.append(lower)
+                self._request_meta(p)
                 added = True
+        if names:
+            self.listbox.insert(tk.END, *names)
         if added and self.idx is None:
             self.idx = 0
 
@@ -289,19 +532,37 @@ class QuartzPlayer(ctk.CTk):
         sel = self.listbox.curselection()
         if not sel:
             return
-        i = sel[0]
-        self.listbox.delete(i)
-        self.playlist.pop(i)
+        row = sel[0]
+        i = self._visible_indices.pop(row)
+        self.listbox.delete(row)
+        p = self.playlist.pop(i)
+        self._playlist_set.discard(p)
+        self._meta_cache.pop(p, None)
+        self._art_photos.pop(p, None)
+        self.basenames.pop(i)
+        self._lower_names.pop(i)
+        self._visible_indices[row:] = [j - 1 for j in self._visible_indices[row:]]
+        self._shuffle_queue.clear()
         if self.idx == i:
             self.stop_song()
             self.idx = None
+            self._loaded_path = None
         elif self.idx is not None and i < self.idx:
             self.idx -= 1
 
     def clear_playlist(self):
         self.listbox.delete(0, tk.END)
         self.playlist.clear()
+        self._playlist_set.clear()
+        self._meta_cache.clear()
+        self._art_photos.clear()
+        self.basenames.clear()
+        self._lower_names.clear()
+        self._visible_indices.clear()
+        self._cancel_prefetch()
+        self._shuffle_queue.clear()
         self.idx = None
+        self._loaded_path = None
         self.stop_song()
 
     def save_playlist(self):
@@ -325,13 +586,24 @@ class QuartzPlayer(ctk.CTk):
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
+    def _schedule_filter(self):
+        # coalesce a burst of keystrokes into one filter pass
+        if self._filter_job:
+            self.after_cancel(self._filter_job)
+        self._filter_job = self.after(120, self._filter_playlist)
+
     def _filter_playlist(self):
         q = self.search_var.get().strip().lower()
         self.listbox.delete(0, tk.END)
-        for p in self.playlist:
-            name = os.path.basename(p)
-            if not q or q in name.lower():
-                self.listbox.insert(tk.END, name)
+        if q:
+            visible = [i for i, n in enumerate(self._lower_names) if q in n]
+        else:
+            visible = list(range(len(self.playlist)))
+        self._visible_indices = visible
+        if visible:
+            names = self.basenames
+            self.listbox.insert(tk.END, *[names[i] for i in visible])
+        self._filter_job = None
 
     # ---- Album art ----
     def _set_art_placeholder(self):
@@ -341,63 +613,229 @@ class QuartzPlayer(ctk.CTk):
         self.art_label.configure(image=tki)
         self.art_label.image = tki
 
-    def _display_pil_image(self, pil_img):
+    def _fit_art(self, pil_img):
+        """Resize to the art slot (None on failure). Safe to call off the GUI thread."""
         try:
-            img = ImageOps.fit(pil_img, (self.art_size, self.art_size), Image.LANCZOS)
-            tki = ImageTk.PhotoImage(img)
-            self.art_label.configure(image=tki)
-            self.art_label.image = tki
+            # contain() scales up small art too, unlike thumbnail()
+            img = ImageOps.contain(pil_img, (self.art_size, self.art_size), ART_RESAMPLE)
+            if img.size == (self.art_size, self.art_size):
+                return img
+            # non-square art: center it on a transparent square
+            canvas = Image.new("RGBA", (self.art_size, self.art_size), (0, 0, 0, 0))
+            canvas.paste(img, ((self.art_size - img.width) // 2, (self.art_size - img.height) // 2))
+            return canvas
         except:
+            return None
+
+    def _display_photo(self, tki):
+        """Show a prepared PhotoImage, or the placeholder when None."""
+        if tki is None:
             self._set_art_placeholder()
+            return
+        self.art_label.configure(image=tki)
+        self.art_label.image = tki
 
-    def _set_art_for(self, path):
-        img = extract_embedded_art(path)
+    def _find_art(self, path, ext=None):
+        """Fitted art: embedded first, then a cover file next to the track.
+        Thumbnails go through the on-disk cache, keyed by the picture bytes or
+        the cover file, so one album is decoded once, not once per track."""
+        img = None
+        data = extract_embedded_art_data(path, ext)
+        if data is not None:
+            key = art_cache_key(data=data)
+            cached = read_art_cache(key)
+            if cached:
+                return cached
+            try:
+                img = Image.open(io.BytesIO(data)).convert("RGBA")
+            except:
+                img = None
+        if img is None:
+            folder = os.path.dirname(path)
+            for name in ("cover.jpg","cover.png","folder.jpg","album.jpg"):
+                cand = os.path.join(folder, name)
+                if os.path.exists(cand):
+                    key = art_cache_key(src=cand)
+                    cached = read_art_cache(key, cand)
+                    if cached:
+                        return cached
+                    try:
+                        img = Image.open(cand)
+                    except:
+                        pass
+                    break
+        if img is None:
+            return None
+        img = self._fit_art(img)
         if img:
-            self._display_pil_image(img)
+            write_art_cache(key, img)
+        return img
+
+    def _set_art_for(self, path, entry):
+        hit, tki = self._cached_photo(path, entry["mtime"])
+        if hit:
+            self._display_photo(tki)
+        else:
+            self._set_art_placeholder()
+            self._request_meta(path, urgent=True, entry=entry)
+
+    def _cached_photo(self, path, mtime):
+        """(hit, PhotoImage or None) from the in-memory art LRU."""
+        hit = self._art_photos.get(path)
+        if hit is None or hit[0] != mtime:
+            return False, None
+        self._art_photos.move_to_end(path)
+        return True, hit[1]
+
+    def _remember_photo(self, path, mtime, tki):
+        self._art_photos[path] = (mtime, tki)
+        self._art_photos.move_to_end(path)
+        while len(self._art_photos) > ART_PHOTO_MAX:
+            self._art_photos.popitem(last=False)
+
+    # ---- Metadata cache ----
+    def _meta_for(self, path):
+        """Cache entry for path; dropped and rebuilt when the file's mtime changes."""
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            mtime = None
+        entry = self._meta_cache.get(path)
+        if entry is None or entry["mtime"] != mtime:
+            entry = {"mtime": mtime}
+            self._meta_cache[path] = entry
+        return entry
+
+    # ---- Background metadata ----
+    def _request_meta(self, path, urgent=False, entry=None):
+        """Queue length + art extraction; urgent jumps ahead of bulk imports.
+        Nothing here stats the file: the worker reads the mtime, and an urgent
+        caller passes the entry it already validated (_load_track) or relies on
+        the cached one (prefetch). Bulk requests only fill in the length and
+        the on-disk thumbnail; Tk images are made just for urgent tracks."""
+        if urgent:
+            if entry is None:
+                entry = self._meta_cache.get(path)
+            if entry and "length" in entry and self._cached_photo(path, entry["mtime"])[0]:
+                return None
+            return self._submit_meta(self._prio_pool, path, True)
+        if path in self._meta_cache or path in self._meta_pending:
+            return None
+        self._meta_pending.add(path)
+        return self._submit_meta(self._pool, path, False)
+
+    def _prefetch_upcoming(self):
+        """Warm the metadata cache for what next_song will most likely play."""
+        self._cancel_prefetch()
+        n = len(self.playlist)
+        if self.idx is None or n < 2:
             return
-        folder = os.path.dirname(path)
-        for name in ("cover.jpg","cover.png","folder.jpg","album.jpg"):
-            cand = os.path.join(folder, name)
-            if os.path.exists(cand):
-                try:
-                    self._display_pil_image(Image.open(cand))
-                    return
-                except:
-                    break
-        self._set_art_placeholder()
+        if self.shuffle:
+            while len(self._shuffle_queue) < 3:
+                self._shuffle_queue.append(random.randrange(n))
+            upcoming = self._shuffle_queue
+        elif self.idx + 1 < n:
+            upcoming = [self.idx + 1]
+        else:
+            upcoming = [0] if self.repeat == "all" else []
+        for i in upcoming:
+            fut = self._request_meta(self.playlist[i], urgent=True)
+            if fut:
+                self._prefetch.append(fut)
+
+    def _cancel_prefetch(self):
+        for fut in self._prefetch:
+            fut.cancel()
+        self._prefetch.clear()
+
+    def _submit_meta(self, pool, *args):
+        fut = pool.submit(self._meta_job, *args)
+        # a cancelled job never runs; post an empty result so the count still drains
+        fut.add_done_callback(lambda f: f.cancelled() and self._meta_results.put(None))
+        self._meta_outstanding += 1
+        if not self._meta_poll_job:
+            self._meta_poll_job = self.after(META_POLL_MS, self._drain_meta)
+        return fut
+
+    def _drain_meta(self):
+        # GUI thread: apply finished results, keep polling only while jobs are out
+        self._meta_poll_job = None
+        while True:
+            try:
+                result = self._meta_results.get_nowait()
+            except queue.Empty:
+                break
+            self._meta_outstanding -= 1
+            if result is not None:
+                self._on_meta_ready(*result)
+        if self._meta_outstanding > 0:
+            self._meta_poll_job = self.after(META_POLL_MS, self._drain_meta)
+
+    def _meta_job(self, path, want_art):
+        # worker thread: no Tk calls at all; exactly one item goes on the queue
+        result = None
+        try:
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                mtime = None
+            ext = _ext(path)
+            length = get_length_fallback(path, ext) or 0.0
+            img = self._find_art(path, ext)   # also writes the disk thumbnail
+            result = (path, mtime, length, img if want_art else None, want_art)
+        finally:
+            self._meta_results.put(result)
+
+    def _on_meta_ready(self, path, mtime, length, img, with_art):
+        self._meta_pending.discard(path)
+        if path not in self._playlist_set:
+            return  # removed or cleared while the job ran
+        entry = self._meta_cache.get(path)
+        if entry is None or entry["mtime"] != mtime:
+            # first result for this path, or the file changed: the worker's stat wins
+            entry = self._meta_cache[path] = {"mtime": mtime}
+        entry["length"] = length
+        if with_art:
+            self._remember_photo(path, mtime, ImageTk.PhotoImage(img) if img else None)
+        if path == self._loaded_path:
+            self.length = entry["length"]
+            self.total_lbl.configure(text="/ " + format_time(self.length))
+            if with_art:
+                self._display_photo(self._art_photos[path][1])
 
     # ---- Playback ----
     def _load_track(self, idx):
         if idx is None or idx < 0 or idx >= len(self.playlist):
             return False
         path = self.playlist[idx]
+        self._cancel_seek()   # a drag still settling belongs to the old track
         try:
             pygame.mixer.music.load(path)
         except Exception as e:
             messagebox.showerror("Load Error", f"Could not load file:\n{e}")
             return False
+        self._loaded_path = path
 
-        # Use fallback to get a reliable length
-        self.length = get_length_fallback(path) or 0.0
+        # one stat per track change; length and art come from the cache, and on
+        # a miss they fill in via _on_meta_ready
+        entry = self._meta_for(path)
+        self.length = entry.get("length", 0.0)
         if self.length and self.length > 0:
             self.total_lbl.configure(text="/ " + format_time(self.length))
         else:
             self.total_lbl.configure(text="/ 00:00")
 
         self.slider.set(0)
-        self.title_label.configure(text=os.path.basename(path))
+        self._last_slider_pct = None
+        self.title_label.configure(text=self.basenames[idx])
         self.path_label.configure(text=os.path.dirname(path))
-        self._set_art_for(path)
+        self._set_art_for(path, entry)
         return True
 
     def play_selected(self):
         sel = self.listbox.curselection()
         if sel:
-            name = self.listbox.get(sel[0])
-            for i,p in enumerate(self.playlist):
-                if os.path.basename(p) == name:
-                    self.idx = i
-                    break
+            self.idx = self._visible_indices[sel[0]]
         else:
             if self.idx is None and self.playlist:
                 self.idx = 0
@@ -410,11 +848,16 @@ class QuartzPlayer(ctk.CTk):
         if not ok:
             return
         pygame.mixer.music.play()
-        pygame.mixer.music.set_volume(self.vol_var.get())
+        self._last_vol = self.vol_var.get()
+        pygame.mixer.music.set_volume(self._last_vol)
+        self._play_base = time.monotonic()
+        self._pause_at = None
         self.playing = True
         self.paused = False
         self.play_btn.configure(text="⏸")
         self._highlight_current()
+        self._start_update_loop()
+        self._prefetch_upcoming()
 
     def play_pause(self):
         if not self.playlist:
@@ -426,26 +869,37 @@ class QuartzPlayer(ctk.CTk):
         else:
             if self.paused:
                 pygame.mixer.music.unpause()
+                if self._pause_at is not None:
+                    self._play_base += time.monotonic() - self._pause_at
+                    self._pause_at = None
                 self.paused = False
                 self.play_btn.configure(text="⏸")
+                self._start_update_loop()
             else:
                 pygame.mixer.music.pause()
+                self._pause_at = time.monotonic()
                 self.paused = True
                 self.play_btn.configure(text="▶")
+                self._stop_update_loop()
 
     def stop_song(self):
+        self._cancel_seek()
         pygame.mixer.music.stop()
+        self._stop_update_loop()
         self.playing = False
         self.paused = False
         self.play_btn.configure(text="▶")
         self.slider.set(0)
         self.curr_lbl.configure(text="00:00")
+        self._last_curr_text = self._last_slider_pct = None
 
     def next_song(self):
         if not self.playlist:
             return
         if self.shuffle:
-            self.idx = random.randrange(len(self.playlist))
+            while self._shuffle_queue and self._shuffle_queue[0] >= len(self.playlist):
+                self._shuffle_queue.pop(0)
+            self.idx = self._shuffle_queue.pop(0) if self._shuffle_queue else random.randrange(len(self.playlist))
         else:
             if self.idx is None:
                 self.idx = 0
@@ -466,16 +920,26 @@ class QuartzPlayer(ctk.CTk):
         self.start_playback()
 
     # ---- Seek: robust + immediate UI update ----
+    def _schedule_seek(self, val):
+        # the slider fires on every pixel of a drag; only seek once it settles
+        self._cancel_seek()
+        self._seek_job = self.after(80, self._on_seek, val)
+
+    def _cancel_seek(self):
+        if self._seek_job:
+            self.after_cancel(self._seek_job)
+            self._seek_job = None
+
     def _on_seek(self, val):
+        self._seek_job = None
         # val: 0..100 (percentage)
         if not self.playing:
             return
         if self.idx is None or self.idx >= len(self.playlist):
             return
-        path = self.playlist[self.idx]
 
-        # compute seconds; refresh length if unknown
-        length = self.length if (self.length and self.length > 0) else get_length_fallback(path)
+        # compute seconds; never probe on the GUI thread, _on_meta_ready fills self.length
+        length = self.length
         if length and length > 0:
             sec = (float(val) / 100.0) * length
         else:
@@ -489,17 +953,15 @@ class QuartzPlayer(ctk.CTk):
         try:
             pygame.mixer.music.play(start=sec)
         except:
-            # don't crash; still update UI
-            pass
-
-        # re-check length and update total label
-        try:
-            new_len = get_length_fallback(path)
-            if new_len and new_len > 0:
-                self.length = new_len
-                self.total_lbl.configure(text="/ " + format_time(self.length))
-        except:
-            pass
+            # SDL_mixer has already halted the track by now (e.g. no seek support
+            # for the format); restart it from the top so the update loop doesn't
+            # see a finished track and skip to the next one
+            try:
+                pygame.mixer.music.play()
+            except:
+                self.stop_song()
+                return
+            sec = val = 0.0
 
         # update UI immediately
         try:
@@ -510,14 +972,27 @@ class QuartzPlayer(ctk.CTk):
                 self.slider.set(val)
         except:
             pass
+        self._last_curr_text = self._last_slider_pct = None
 
-        # use manual pos for next update loop iteration
-        self._manual_seek_pos = sec
+        # play(start=...) restarts the clock at sec, and also resumes a paused track
+        self._play_base = time.monotonic() - sec
+        self._pause_at = None
+        if self.paused:
+            self.paused = False
+            self.play_btn.configure(text="⏸")
+            self._start_update_loop()
 
     # ---- Misc ----
     def set_volume(self, *a):
+        vol = self.vol_var.get()
+        # skip sub-1% drag steps, but always land exactly on the ends
+        if abs(vol - self._last_vol) <= 0.01 and vol not in (0.0, 1.0):
+            return
+        if vol == self._last_vol:
+            return
         try:
-            pygame.mixer.music.set_volume(self.vol_var.get())
+            pygame.mixer.music.set_volume(vol)
+            self._last_vol = vol
         except:
             pass
 
@@ -533,48 +1008,78 @@ class QuartzPlayer(ctk.CTk):
         else:
             self.repeat = "off"; self.repeat_btn.configure(text="Repeat: Off")
 
+    def _on_close(self):
+        # drop queued metadata jobs so the interpreter doesn't wait on them
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._prio_pool.shutdown(wait=False, cancel_futures=True)
+        self._stop_update_loop()
+        if self._meta_poll_job:
+            self.after_cancel(self._meta_poll_job)
+            self._meta_poll_job = None
+        self.destroy()
+
     def _highlight_current(self):
-        # refresh filter then select current basename
-        self._filter_playlist()
+        # select the current track's row if the filter shows it
         if self.idx is None: return
-        base = os.path.basename(self.playlist[self.idx])
-        for i in range(self.listbox.size()):
-            if self.listbox.get(i) == base:
-                self.listbox.selection_clear(0, tk.END)
-                self.listbox.selection_set(i)
-                self.listbox.see(i)
-                break
+        try:
+            row = self._visible_indices.index(self.idx)
+        except ValueError:
+            return
+        self.listbox.selection_clear(0, tk.END)
+        self.listbox.selection_set(row)
+        self.listbox.see(row)
 
     # ---- Update loop ----
+    def _start_update_loop(self):
+        if not self._update_job:
+            self._update_job = self.after(UPDATE_MS, self._update_loop)
+
+    def _stop_update_loop(self):
+        if self._update_job:
+            self.after_cancel(self._update_job)
+            self._update_job = None
+
+    def _track_ended(self):
+        # the loop is stopped while paused, so not busy here means the track finished
+        return not pygame.mixer.music.get_busy()
+
     def _update_loop(self):
+        # only runs while playing; pause/stop cancel it and play restarts it
+        self._update_job = None
         if self.playing and not self.paused:
-            # use manual seek position once if present
-            if self._manual_seek_pos is not None:
-                pos = self._manual_seek_pos
-                self._manual_seek_pos = None
-            else:
-                pos = pygame.mixer.music.get_pos() / 1000.0
+            # wall-clock position; get_pos() restarts at 0 after every seek
+            pos = time.monotonic() - self._play_base
             if pos < 0:
                 pos = 0
+            elif self.length and pos > self.length:
+                pos = self.length
 
-            if self.length and pos >= self.length - 0.4:
-                # track ended
+            if self._track_ended():
                 if self.repeat == "one":
                     pygame.mixer.music.play()
+                    self._play_base = time.monotonic()
                 else:
                     self.next_song()
             else:
-                if self.length and self.length > 0:
+                # only touch the widgets when the visible value changes
+                if self.length and self.length > 0 and not self._seek_job:
+                    pct = int((pos / self.length) * 100)
+                    if pct != self._last_slider_pct:
+                        try:
+                            self.slider.set(pct)
+                            self._last_slider_pct = pct
+                        except:
+                            pass
+                text = format_time(pos)
+                if text != self._last_curr_text:
                     try:
-                        self.slider.set((pos / self.length) * 100)
+                        self.curr_lbl.configure(text=text)
+                        self._last_curr_text = text
                     except:
                         pass
-                try:
-                    self.curr_lbl.configure(text=format_time(pos))
-                except:
-                    pass
 
-        self.after(250, self._update_loop)
+        if self.playing and not self.paused:
+            self._start_update_loop()
 
 # ---- Run ----
 if __name__ == "__main__":